@@ -83,6 +83,14 @@ class Config:
     MOVIE_CSV_PATH: Path = DATA_DIR / APP_CONFIG["database"]["csv_file"]
     DB_ENCODING: str = APP_CONFIG["database"]["encoding"]
     DB_CHUNK_SIZE: int = APP_CONFIG["database"]["chunk_size"]
+    # Pickled autocomplete tries, keyed by a hash of the titles they hold;
+    # defaults to the current user's own cache directory
+    TRIE_CACHE_DIR: Path = Path(
+        os.getenv(
+            "TRIE_CACHE_DIR",
+            Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "cinefusion",
+        )
+    )
 
     # Search Configuration from JSON
     MAX_SEARCH_RESULTS: int = APP_CONFIG["search"]["max_limit"]
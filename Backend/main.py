@@ -58,6 +58,8 @@ sys.path.append(str(process_dir))
 # Global variables for data structures
 avl_tree = None
 trie = None
+# Background task building the startup trie, while it is still running
+trie_task: Optional[asyncio.Task] = None
 movies_df = None
 startup_time = time.time()
 
@@ -360,11 +362,17 @@ class StatsResponse(BaseModel):
     system: Dict[str, Any]
 
 
+def get_movie_titles(df: pd.DataFrame) -> List[str]:
+    """Strip movie titles in one vectorised pass, dropping missing and blank ones"""
+    titles = df["movie_title"].dropna().astype(str).str.strip()
+    return titles[titles != ""].tolist()
+
+
 # Async context manager for application lifecycle
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application resources"""
-    global avl_tree, trie, movies_df
+    global avl_tree, trie, trie_task, movies_df
 
     logger.info(f"Starting {config.APP_NAME} v{config.APP_VERSION}")
 
@@ -382,25 +390,18 @@ async def lifespan(app: FastAPI):
         movies_df = pd.read_csv(config.MOVIE_CSV_PATH, encoding=config.DB_ENCODING)
         logger.info(f"Loaded {len(movies_df)} movies from CSV")
 
+        movie_titles = get_movie_titles(movies_df)
+
         # Initialize AVL Tree
         logger.info("Initializing AVL Tree...")
         avl_tree = AVLTree()
-        for title in movies_df["movie_title"].dropna():
-            clean_title = title.strip()
-            if clean_title:
-                avl_tree.insert(clean_title)
+        avl_tree.build_from_keys(movie_titles)
         logger.info("AVL Tree initialized successfully")
 
-        # Initialize Trie
-        logger.info("Initializing Autocomplete Trie...")
-        trie = Trie()
-        movie_titles = [
-            title.strip()
-            for title in movies_df["movie_title"].dropna()
-            if title.strip()
-        ]
-        trie.formTrie(movie_titles)
-        logger.info("Trie initialized successfully")
+        # Initialize Trie in the background; suggestions fall back to the
+        # DataFrame until it is ready
+        logger.info("Initializing Autocomplete Trie in the background...")
+        trie_task = asyncio.create_task(build_trie(Trie, movie_titles))
 
         # Restore original working directory
         os.chdir(original_cwd)
@@ -420,10 +421,26 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
+    if trie_task is not None:
+        trie_task.cancel()
     logger.info("Shutting down CineFusion backend")
 
 
 # Background tasks
+async def build_trie(trie_class, movie_titles: List[str]) -> None:
+    """Build the autocomplete trie off the event loop and publish it when done"""
+    global trie, trie_task
+    try:
+        trie = await asyncio.to_thread(
+            trie_class.load_or_build, movie_titles, config.TRIE_CACHE_DIR
+        )
+        logger.info("Trie initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize trie: {e}")
+    finally:
+        trie_task = None
+
+
 async def periodic_cache_cleanup():
     """Periodic cache cleanup task"""
     while True:
@@ -1054,8 +1071,10 @@ async def get_suggestions(
     try:
         suggestions = []
         total_available = 0
+        # Fallback answers are only served until the trie is ready
+        use_trie = trie is not None
 
-        if trie:
+        if use_trie:
             # Use trie for suggestions
             all_suggestions = trie.printAutoSuggestions(q)
             if isinstance(all_suggestions, list):
@@ -1068,16 +1087,12 @@ async def get_suggestions(
         else:
             # Fallback: search in DataFrame
             if movies_df is not None:
+                # Normalise titles the same way the trie does
                 query_lower = q.lower()
-                matching_titles = (
-                    movies_df[
-                        movies_df["movie_title"]
-                        .str.lower()
-                        .str.startswith(query_lower, na=False)
-                    ]["movie_title"]
-                    .dropna()
-                    .unique()
+                titles = (
+                    movies_df["movie_title"].dropna().astype(str).str.strip().str.lower()
                 )
+                matching_titles = titles[titles.str.startswith(query_lower)].unique()
                 suggestions = list(matching_titles)[:limit]
                 total_available = len(matching_titles)
 
@@ -1092,7 +1107,7 @@ async def get_suggestions(
         }
 
         # Cache the result
-        if cache:
+        if cache and use_trie:
             cache.set(cache_key, result)
 
         return SuggestionsResponse(**result)
@@ -1376,8 +1391,13 @@ if config.DEBUG:
     @app.post(f"{config.API_PREFIX}/admin/reload")
     async def reload_data():
         """Reload movie data (development only)"""
-        global movies_df, avl_tree, trie
+        global movies_df, avl_tree, trie, trie_task
         try:
+            # Stop the startup build from publishing a trie of the old titles
+            if trie_task is not None:
+                trie_task.cancel()
+                trie_task = None
+
             # Reload data
             movies_df = pd.read_csv(config.MOVIE_CSV_PATH, encoding=config.DB_ENCODING)
 
@@ -1385,19 +1405,12 @@ if config.DEBUG:
             from trie import Trie
             from avl import AVLTree
 
+            movie_titles = get_movie_titles(movies_df)
+
             avl_tree = AVLTree()
-            for title in movies_df["movie_title"].dropna():
-                clean_title = title.strip()
-                if clean_title:
-                    avl_tree.insert(clean_title)
-
-            trie = Trie()
-            movie_titles = [
-                title.strip()
-                for title in movies_df["movie_title"].dropna()
-                if title.strip()
-            ]
-            trie.formTrie(movie_titles)
+            avl_tree.build_from_keys(movie_titles)
+
+            trie = Trie.load_or_build(movie_titles, config.TRIE_CACHE_DIR)
 
             # Clear cache
             if cache:
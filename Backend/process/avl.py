@@ -3,17 +3,21 @@ AVL Tree Implementation for CineFusion Backend
 A self-balancing binary search tree for efficient movie title storage and retrieval
 """
 
-from typing import Optional, List
+from bisect import bisect_left
+from typing import Iterable, Optional, List, Tuple
 
 
 class AVLNode:
     """Node class for AVL Tree"""
 
+    __slots__ = ("key", "left", "right", "bf")
+
     def __init__(self, key: str) -> None:
         self.key = key
         self.left: Optional['AVLNode'] = None
         self.right: Optional['AVLNode'] = None
-        self.height = 1
+        # Balance factor: height(left) - height(right), kept within -2..2
+        self.bf = 0
 
 
 class AVLTree:
@@ -21,23 +25,25 @@ class AVLTree:
 
     def __init__(self) -> None:
         self.root: Optional[AVLNode] = None
+        # Sorted keys are cached and only re-traversed after a mutation
+        self._sorted_keys: List[str] = []
+        self._dirty = False
+        # (lowercased key, key) pairs for case-insensitive prefix lookups
+        self._prefix_index: Optional[List[Tuple[str, str]]] = None
 
     def _height(self, node: Optional[AVLNode]) -> int:
-        """Get height of a node"""
-        if node is None:
-            return 0
-        return node.height
-
-    def _update_height(self, node: Optional[AVLNode]) -> None:
-        """Update height of a node"""
-        if node is not None:
-            node.height = max(self._height(node.left), self._height(node.right)) + 1
+        """Get height of a node by walking down its heavier side"""
+        height = 0
+        while node is not None:
+            height += 1
+            node = node.right if node.bf < 0 else node.left
+        return height
 
     def _balance_factor(self, node: Optional[AVLNode]) -> int:
-        """Calculate balance factor of a node"""
+        """Get balance factor of a node"""
         if node is None:
             return 0
-        return self._height(node.left) - self._height(node.right)
+        return node.bf
 
     def _rotate_left(self, y: AVLNode) -> AVLNode:
         """Perform left rotation"""
@@ -49,8 +55,8 @@ class AVLTree:
         x.left = y
         y.right = t2
 
-        self._update_height(y)
-        self._update_height(x)
+        y.bf = y.bf + 1 - min(x.bf, 0)
+        x.bf = x.bf + 1 + max(y.bf, 0)
         return x
 
     def _rotate_right(self, x: AVLNode) -> AVLNode:
@@ -63,8 +69,8 @@ class AVLTree:
         y.right = x
         x.left = t2
 
-        self._update_height(x)
-        self._update_height(y)
+        x.bf = x.bf - 1 - max(y.bf, 0)
+        y.bf = y.bf - 1 + min(x.bf, 0)
         return y
 
     def _balance(self, node: Optional[AVLNode]) -> Optional[AVLNode]:
@@ -72,18 +78,15 @@ class AVLTree:
         if node is None:
             return None
 
-        node.height = max(self._height(node.left), self._height(node.right)) + 1
-        balance = self._balance_factor(node)
-
         # Left heavy
-        if balance > 1:
-            if node.left and self._balance_factor(node.left) < 0:
+        if node.bf > 1:
+            if node.left and node.left.bf < 0:
                 node.left = self._rotate_left(node.left)
             return self._rotate_right(node)
 
         # Right heavy
-        if balance < -1:
-            if node.right and self._balance_factor(node.right) > 0:
+        if node.bf < -1:
+            if node.right and node.right.bf > 0:
                 node.right = self._rotate_right(node.right)
             return self._rotate_left(node)
 
@@ -99,22 +102,80 @@ class AVLTree:
             return False
 
         self.root = self._insert(self.root, key)
+        self._dirty = True
         return True
 
-    def _insert(self, node: Optional[AVLNode], key: str) -> AVLNode:
-        """Internal insert method"""
-        if node is None:
+    def build_from_keys(self, keys: Iterable[str]) -> int:
+        """Replace the tree with a perfectly balanced one built from keys in O(n)"""
+        sorted_keys = sorted({
+            key.strip() for key in keys
+            if isinstance(key, str) and key.strip()
+        })
+        self.root = self._build_balanced(sorted_keys, 0, len(sorted_keys) - 1)
+        # The input is already in inorder order, so seed the cache directly
+        self._sorted_keys = sorted_keys
+        self._dirty = False
+        self._prefix_index = None
+        return len(sorted_keys)
+
+    def _build_balanced(self, keys: List[str], low: int, high: int) -> Optional[AVLNode]:
+        """Build a balanced subtree from keys[low..high] by midpoint splitting"""
+        if low > high:
+            return None
+
+        mid = (low + high) // 2
+        node = AVLNode(keys[mid])
+        node.left = self._build_balanced(keys, low, mid - 1)
+        node.right = self._build_balanced(keys, mid + 1, high)
+        # Midpoint splitting yields a subtree of height n.bit_length() for n keys
+        node.bf = (mid - low).bit_length() - (high - mid).bit_length()
+        return node
+
+    def _insert(self, root: Optional[AVLNode], key: str) -> AVLNode:
+        """Internal insert method, walking down with an explicit path stack"""
+        if root is None:
             return AVLNode(key)
 
-        # Avoid duplicates
-        if key == node.key:
-            return node
-        elif key < node.key:
-            node.left = self._insert(node.left, key)
+        # Record (node, went_left) for every step taken from the root
+        path = []
+        node = root
+        while node is not None:
+            # Avoid duplicates
+            if key == node.key:
+                return root
+            went_left = key < node.key
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = AVLNode(key)
         else:
-            node.right = self._insert(node.right, key)
-
-        return self._balance(node)
+            parent.right = AVLNode(key)
+
+        # Adjust balance factors bottom-up while the subtree keeps growing
+        while path:
+            node, went_left = path.pop()
+            node.bf += 1 if went_left else -1
+            if node.bf == 0:
+                # Height unchanged, so no ancestor is affected
+                break
+            if -1 <= node.bf <= 1:
+                continue
+
+            # A rotation restores the subtree to its height before the insert
+            subtree = self._balance(node)
+            if path:
+                parent, went_left = path[-1]
+                if went_left:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+            else:
+                root = subtree
+            break
+
+        return root
 
     def search(self, key: str) -> bool:
         """Search for a key in the tree"""
@@ -124,28 +185,43 @@ class AVLTree:
 
     def _search(self, node: Optional[AVLNode], key: str) -> bool:
         """Internal search method"""
-        if node is None:
-            return False
-
-        if key == node.key:
-            return True
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        while node is not None:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
 
     def _inorder(self, node: Optional[AVLNode], result: List[str]) -> None:
         """Internal inorder traversal method"""
-        if node:
-            self._inorder(node.left, result)
-            result.append(node.key)
-            self._inorder(node.right, result)
+        stack = []
+        append = result.append
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            append(node.key)
+            node = node.right
+
+    def _keys(self) -> List[str]:
+        """Get the cached sorted keys, rebuilding them if the tree changed"""
+        if self._dirty:
+            self._sorted_keys = []
+            self._inorder(self.root, self._sorted_keys)
+            self._dirty = False
+            self._prefix_index = None
+        return self._sorted_keys
+
+    def _index(self) -> List[Tuple[str, str]]:
+        """Get the cached case-insensitive prefix index"""
+        keys = self._keys()
+        if self._prefix_index is None:
+            self._prefix_index = sorted((key.lower(), key) for key in keys)
+        return self._prefix_index
 
     def inorder(self) -> List[str]:
         """Get inorder traversal of the tree (sorted order)"""
-        result: List[str] = []
-        self._inorder(self.root, result)
-        return result
+        return list(self._keys())
 
     def get_suggestions(self, prefix: str, max_suggestions: int = 10) -> List[str]:
         """Get autocomplete suggestions for a given prefix"""
@@ -153,26 +229,22 @@ class AVLTree:
             return []
 
         suggestions = []
-        all_keys = self.inorder()
 
+        # Matches form one contiguous run in the index, so bisect to its start
         prefix_lower = prefix.lower()
-        for key in all_keys:
-            if key.lower().startswith(prefix_lower):
-                suggestions.append(key)
-                if len(suggestions) >= max_suggestions:
-                    break
+        index = self._index()
+        for i in range(bisect_left(index, (prefix_lower,)), len(index)):
+            key_lower, key = index[i]
+            if not key_lower.startswith(prefix_lower) or len(suggestions) >= max_suggestions:
+                break
+            suggestions.append(key)
 
         return suggestions
 
     def get_tree_stats(self) -> dict:
         """Get statistics about the tree"""
-        def count_nodes(node: Optional[AVLNode]) -> int:
-            if node is None:
-                return 0
-            return 1 + count_nodes(node.left) + count_nodes(node.right)
-
         return {
-            'total_nodes': count_nodes(self.root),
+            'total_nodes': len(self._keys()),
             'height': self._height(self.root),
             'is_empty': self.root is None
         }
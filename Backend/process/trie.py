@@ -3,11 +3,51 @@ Backend-only Trie Implementation for CineFusion
 A clean implementation without GUI components for API use
 """
 
+import hashlib
+import os
+import pickle
+import stat
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# Maximum number of autocomplete suggestions collected per prefix
+MAX_SUGGESTIONS = 20
+
+# Number of recent prefixes whose suggestions are memoised
+PREFIX_CACHE_SIZE = 256
+
+# Bump whenever the node layout changes so stale pickles are not reused
+CACHE_FORMAT = "radix-5"
+
+def _is_private_dir(path: Path) -> bool:
+    """
+    Create path if needed and check that only the current user can use it
+    Pickles are only trusted from a real directory owned by this user with
+    no group or other permissions
+    """
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(path)
+    except OSError:
+        return False
+
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if hasattr(os, "getuid"):
+        return info.st_uid == os.getuid() and stat.S_IMODE(info.st_mode) == 0o700
+    return True
+
 class TrieNode:
-    """Node class for Trie data structure"""
-    def __init__(self):
-        self.children = {}
-        self.is_end_of_word = False
+    """Node class for a compressed (radix) Trie, labelled by the edge leading into it"""
+    __slots__ = ("edge", "children", "is_end_of_word")
+
+    def __init__(self, edge: str = "", is_end_of_word: bool = False):
+        self.edge = edge
+        # Children are keyed by the first character of their edge; leaves,
+        # which make up most nodes, keep None instead of an empty dict
+        self.children: Optional[dict] = None
+        self.is_end_of_word = is_end_of_word
 
 class Trie:
     """
@@ -17,37 +57,152 @@ class Trie:
 
     def __init__(self):
         self.root = TrieNode()
-        self.suggestions_list = []
+        # Lowercased prefix -> 0, -1 or a tuple of suggestions, oldest first
+        self._prefix_cache: Dict[str, Union[int, Tuple[str, ...]]] = {}
 
     def insert(self, word: str):
         """Insert a word into the trie"""
         if not word:
             return
 
+        self._insert_lower(word.lower())
+
+    def _insert_lower(self, word: str):
+        """Insert a word that is already lowercased"""
+        if self._prefix_cache:
+            self._prefix_cache.clear()
+
         node = self.root
-        for char in word.lower():
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+        i = 0
+        length = len(word)
+        while i < length:
+            children = node.children
+            child = children.get(word[i]) if children else None
+            if child is None:
+                if children is None:
+                    children = node.children = {}
+                children[word[i]] = TrieNode(word[i:], True)
+                return
+
+            edge = child.edge
+            if word.startswith(edge, i):
+                node = child
+                i += len(edge)
+                continue
+
+            # Split the edge where the word diverges from it
+            common = 1
+            limit = min(len(edge), length - i)
+            while common < limit and edge[common] == word[i + common]:
+                common += 1
+            split = TrieNode(edge[:common])
+            child.edge = edge[common:]
+            split.children = {child.edge[0]: child}
+            node.children[word[i]] = split
+            node = split
+            i += common
+
         node.is_end_of_word = True
 
     def formTrie(self, keys: list):
         """Build trie from a list of keys/words"""
-        for key in keys:
-            if key and isinstance(key, str):
-                self.insert(key.strip())
+        # Normalise and drop duplicates up front so each word is walked once
+        words = dict.fromkeys(
+            key.strip().lower() for key in keys
+            if key and isinstance(key, str)
+        )
+        insert_lower = self._insert_lower
+        for word in words:
+            if word:
+                insert_lower(word)
 
-    def _suggestion_rec(self, node: TrieNode, word: str):
-        """Recursive helper function to collect suggestions"""
-        if len(self.suggestions_list) >= 20:  # Limit suggestions
-            return
+    @classmethod
+    def load_or_build(cls, keys: list, cache_dir: Optional[Union[str, Path]] = None) -> "Trie":
+        """
+        Build a trie from keys, reusing a pickled copy when the keys are unchanged
+        The cache is best effort: unreadable or unwritable cache files, or a
+        cache directory other users can reach, only mean the trie is rebuilt
+        """
+        cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if cache_dir is None or not _is_private_dir(cache_dir):
+            trie = cls()
+            trie.formTrie(keys)
+            return trie
+
+        words = "\0".join(key for key in keys if isinstance(key, str))
+        digest = hashlib.blake2b(CACHE_FORMAT.encode(), digest_size=16)
+        digest.update(words.encode("utf-8", "surrogatepass"))
+        cache_path = cache_dir / f"trie.{digest.hexdigest()}.pkl"
+
+        try:
+            with open(cache_path, "rb") as f:
+                trie = pickle.load(f)
+            if isinstance(trie, cls):
+                return trie
+        except Exception:
+            pass
 
-        if node.is_end_of_word:
-            self.suggestions_list.append(word)
+        trie = cls()
+        trie.formTrie(keys)
 
-        for char, child_node in node.children.items():
-            if len(self.suggestions_list) < 20:
-                self._suggestion_rec(child_node, word + char)
+        try:
+            # Write under a temporary name so readers never see a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(trie, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            for stale in cache_dir.glob("trie.*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+        return trie
+
+    def _find_node(self, prefix: str) -> Optional[Tuple[TrieNode, str]]:
+        """
+        Walk down to the node covering a lowercased prefix
+        Returns the node and the full string spelled out to reach it, which
+        extends past the prefix when the prefix ends partway along an edge,
+        or None if the prefix is absent
+        """
+        node = self.root
+        i = 0
+        length = len(prefix)
+        while i < length:
+            children = node.children
+            child = children.get(prefix[i]) if children else None
+            if child is None:
+                return None
+
+            edge = child.edge
+            if prefix.startswith(edge, i):
+                node = child
+                i += len(edge)
+            elif edge.startswith(prefix[i:]):
+                return child, prefix[:i] + edge
+            else:
+                return None
+        return node, prefix
+
+    def _iter_words(self, node: TrieNode, prefix: str) -> Iterator[str]:
+        """Yield the words below a node in depth-first order without recursion"""
+        # The path holds one edge label per level; entries record their depth
+        parts = [prefix]
+        stack = [(node, "", 1)]
+        while stack:
+            node, edge, depth = stack.pop()
+            del parts[depth:]
+            if edge:
+                parts.append(edge)
+            if node.is_end_of_word:
+                yield "".join(parts)
+            if node.children:
+                # Reverse so children are visited in insertion order
+                stack.extend(
+                    (child, child.edge, len(parts))
+                    for child in reversed(node.children.values())
+                )
 
     def printAutoSuggestions(self, prefix: str):
         """
@@ -60,66 +215,59 @@ class Trie:
         if not prefix:
             return 0
 
-        node = self.root
-        self.suggestions_list = []
+        prefix = prefix.lower()
+        cache = self._prefix_cache
+        result = cache.pop(prefix, None)
+        if result is None:
+            result = self._lookup_suggestions(prefix)
+            if len(cache) >= PREFIX_CACHE_SIZE:
+                # Evict the least recently used prefix
+                del cache[next(iter(cache))]
+        # (Re)insert so the dict stays ordered from least to most recent
+        cache[prefix] = result
+
+        if isinstance(result, int):
+            return result
+
+        # Hand out a fresh list so callers cannot mutate the cached tuple
+        return list(result)
 
+    def _lookup_suggestions(self, prefix: str) -> Union[int, Tuple[str, ...]]:
+        """Walk the trie for a lowercased prefix, returning 0, -1 or the suggestions"""
         # Navigate to the prefix node
-        for char in prefix.lower():
-            if char not in node.children:
-                return 0  # Prefix not found
-            node = node.children[char]
+        found = self._find_node(prefix)
+        if found is None:
+            return 0  # Prefix not found
+        node, path = found
 
         # If no children, the prefix itself is a complete word but no suggestions
-        if not node.children:
+        if path == prefix and not node.children:
             return -1
 
         # Collect suggestions
-        self._suggestion_rec(node, prefix.lower())
-
-        return self.suggestions_list if self.suggestions_list else 0
+        suggestions = tuple(islice(self._iter_words(node, path), MAX_SUGGESTIONS))
+        return suggestions if suggestions else 0
 
     def search(self, word: str) -> bool:
         """Search if a word exists in the trie"""
         if not word:
             return False
 
-        node = self.root
-        for char in word.lower():
-            if char not in node.children:
-                return False
-            node = node.children[char]
-
-        return node.is_end_of_word
+        word = word.lower()
+        found = self._find_node(word)
+        return found is not None and found[1] == word and found[0].is_end_of_word
 
     def get_all_words_with_prefix(self, prefix: str, max_results: int = 10) -> list:
         """Get all words that start with the given prefix"""
         if not prefix:
             return []
 
-        node = self.root
-
-        # Navigate to prefix
-        for char in prefix.lower():
-            if char not in node.children:
-                return []
-            node = node.children[char]
-
-        # Collect words
-        results = []
-        self._collect_words(node, prefix.lower(), results, max_results)
-        return results
-
-    def _collect_words(self, node: TrieNode, current_word: str, results: list, max_results: int):
-        """Helper function to collect words starting from a node"""
-        if len(results) >= max_results:
-            return
-
-        if node.is_end_of_word:
-            results.append(current_word)
+        prefix = prefix.lower()
+        found = self._find_node(prefix)
+        if found is None:
+            return []
 
-        for char, child_node in node.children.items():
-            if len(results) < max_results:
-                self._collect_words(child_node, current_word + char, results, max_results)
+        return list(islice(self._iter_words(*found), max_results))
 
 Node = TrieNode
 
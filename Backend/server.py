@@ -10,15 +10,28 @@ import sys
 import json
 import time
 import signal
+import shlex
 import subprocess
 import argparse
+import importlib.util
+from functools import reduce
+from operator import getitem
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
-from datetime import datetime
+
+# Resolved once so every path below is built without re-parsing __file__
+_HERE = Path(__file__).resolve().parent
+_REPO_ROOT = _HERE.parent
+_DATA_DIR = _HERE / "data"
+_LOGS_DIR = _HERE / "logs"
+_CONFIG_ROOT = _REPO_ROOT / "config.json"
+_CONFIG_DATA = _DATA_DIR / "config.json"
+_TEST_FILE = _HERE / "test.py"
+_UNIT_TEST_FILE = _HERE / "test_unit.py"
 
 # Add current directory to path
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(_HERE))
 
 # Import custom logging
 from logger import setup_logging, get_request_logger
@@ -29,22 +42,83 @@ environment = "development"  # Server management always uses development logging
 loggers = setup_logging(environment=environment)
 logger = loggers["app"]
 
+# Configuration sections required by validate_json_config
+_REQUIRED_UNIFIED = frozenset(("application", "frontend", "backend", "admin"))
+_BACKEND_REQUIRED = frozenset(
+    (
+        "server",
+        "api",
+        "database",
+        "logging",
+        "monitoring",
+        "cache",
+        "search",
+        "suggestions",
+        "security",
+    )
+)
+_REQUIRED_LEGACY = _BACKEND_REQUIRED | {"application"}
+
+# Required fields as pre-split key paths with their expected types
+_VALIDATION_FIELDS = (
+    (("application", "name"), str),
+    (("application", "version"), str),
+    (("backend", "server", "host"), str),
+    (("backend", "server", "port"), int),
+    (("backend", "database", "csv_file"), str),
+    (("backend", "api", "prefix"), str),
+)
+
+
+_LOG_FLUSH_EVERY = 64
+
+
+def _log_lines(log, prefix: str, output: Optional[str]) -> None:
+    """Log captured process output in batches instead of one record per line"""
+    if not output:
+        return
+
+    buf: List[str] = []
+    for line in output.splitlines():
+        line = line.rstrip()
+        if line:
+            buf.append(line)
+            if len(buf) >= _LOG_FLUSH_EVERY:
+                log(f"{prefix}:\n  " + "\n  ".join(buf))
+                buf.clear()
+    if buf:
+        log(f"{prefix}:\n  " + "\n  ".join(buf))
+
 
 class CineFusionServer:
     """Comprehensive server manager for CineFusion"""
 
-    def __init__(self):
-        self.config = get_config()
+    def __init__(self, install_signal_handlers: bool = True):
+        self._config = None
         self.processes = []
         self.shutdown_requested = False
-        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+        self.start_wall = time.time()
 
         # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        if install_signal_handlers:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
 
         logger.info("CineFusion Server Manager initialized")
 
+    @property
+    def config(self):
+        """Environment config, loaded on first access"""
+        if self._config is None:
+            self._config = get_config()
+        return self._config
+
+    @classmethod
+    def for_validation(cls) -> "CineFusionServer":
+        """Create a lightweight instance for validate/health commands"""
+        return cls(install_signal_handlers=False)
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
@@ -57,11 +131,11 @@ class CineFusionServer:
         logger.info("Validating JSON configuration...")
 
         # First try to load from root directory (new location)
-        config_file = Path(__file__).parent.parent / "config.json"
+        config_file = _CONFIG_ROOT
 
         # Fallback to old location for compatibility
         if not config_file.exists():
-            config_file = Path(__file__).parent / "data" / "config.json"
+            config_file = _CONFIG_DATA
 
         try:
             # Check if config file exists
@@ -73,84 +147,40 @@ class CineFusionServer:
             with open(config_file, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
-            # Check if it's the new unified config format
+            # Check required sections for the unified or legacy config format
             if "backend" in config_data:
-                # Validate unified config structure
-                required_sections = ["application", "frontend", "backend", "admin"]
-                backend_config = config_data.get("backend", {})
-                backend_required = [
-                    "server",
-                    "api",
-                    "database",
-                    "logging",
-                    "monitoring",
-                    "cache",
-                    "search",
-                    "suggestions",
-                    "security",
+                missing_sections = sorted(_REQUIRED_UNIFIED - config_data.keys())
+                missing_sections += [
+                    f"backend.{section}"
+                    for section in sorted(
+                        _BACKEND_REQUIRED - config_data["backend"].keys()
+                    )
                 ]
             else:
-                # Legacy config format
-                required_sections = [
-                    "application",
-                    "server",
-                    "api",
-                    "database",
-                    "logging",
-                    "monitoring",
-                    "cache",
-                    "search",
-                    "suggestions",
-                    "security",
-                ]
-                backend_config = config_data
-                backend_required = required_sections
-
-            missing_sections = []
-            for section in required_sections:
-                if section not in config_data:
-                    missing_sections.append(section)
-
-            # Check backend-specific sections if unified config
-            if "backend" in config_data:
-                for section in backend_required:
-                    if section not in backend_config:
-                        missing_sections.append(f"backend.{section}")
+                missing_sections = sorted(_REQUIRED_LEGACY - config_data.keys())
 
             if missing_sections:
                 logger.error(f"Missing configuration sections: {missing_sections}")
                 return False
 
             # Validate specific required fields
-            validations = [
-                ("application.name", str),
-                ("application.version", str),
-                ("backend.server.host", str),
-                ("backend.server.port", int),
-                ("backend.database.csv_file", str),
-                ("backend.api.prefix", str),
-            ]
-
-            for field_path, expected_type in validations:
+            for keys, expected_type in _VALIDATION_FIELDS:
+                field_path = ".".join(keys)
                 try:
-                    keys = field_path.split(".")
-                    value = config_data
-                    for key in keys:
-                        value = value[key]
-
-                    if not isinstance(value, expected_type):
-                        logger.error(
-                            f"Invalid type for {field_path}: expected {expected_type.__name__}, got {type(value).__name__}"
-                        )
-                        return False
-
-                except KeyError:
+                    value = reduce(getitem, keys, config_data)
+                except (KeyError, TypeError):
                     logger.error(f"Missing required configuration field: {field_path}")
                     return False
 
+                # All expected types are concrete, so skip the isinstance MRO walk
+                if type(value) is not expected_type:
+                    logger.error(
+                        f"Invalid type for {field_path}: expected {expected_type.__name__}, got {type(value).__name__}"
+                    )
+                    return False
+
             # Validate file paths
-            data_dir = Path(__file__).parent / "data"
-            csv_file = data_dir / config_data["backend"]["database"]["csv_file"]
+            csv_file = _DATA_DIR / config_data["backend"]["database"]["csv_file"]
 
             if not csv_file.exists():
                 logger.error(f"Movie data file not found: {csv_file}")
@@ -181,9 +211,8 @@ class CineFusionServer:
 
             missing_packages = []
             for package in required_packages:
-                try:
-                    __import__(package)
-                except ImportError:
+                # find_spec only locates the package, it does not import it
+                if importlib.util.find_spec(package) is None:
                     missing_packages.append(package)
 
             if missing_packages:
@@ -194,18 +223,16 @@ class CineFusionServer:
                 return False
 
             # Check data files
-            data_dir = Path(__file__).parent / "data"
             required_files = ["config.json", self.config.MOVIE_CSV_PATH.name]
 
             for file_name in required_files:
-                file_path = data_dir / file_name
+                file_path = _DATA_DIR / file_name
                 if not file_path.exists():
                     logger.error(f"Required file not found: {file_path}")
                     return False
 
             # Check log directory
-            log_dir = Path(__file__).parent / "logs"
-            log_dir.mkdir(exist_ok=True)
+            _LOGS_DIR.mkdir(exist_ok=True)
 
             # Check disk space
             try:
@@ -236,7 +263,7 @@ class CineFusionServer:
         try:
             # If unit_only flag is set, run unit tests that don't require server
             if unit_only:
-                unit_test_file = Path(__file__).parent / "test_unit.py"
+                unit_test_file = _UNIT_TEST_FILE
                 if not unit_test_file.exists():
                     logger.error("Unit test file not found: test_unit.py")
                     return False
@@ -253,15 +280,8 @@ class CineFusionServer:
                     )
 
                     # Log test output
-                    if result.stdout:
-                        for line in result.stdout.split("\n"):
-                            if line.strip():
-                                logger.info(f"UNIT TEST: {line}")
-
-                    if result.stderr:
-                        for line in result.stderr.split("\n"):
-                            if line.strip():
-                                logger.warning(f"UNIT TEST ERROR: {line}")
+                    _log_lines(logger.info, "UNIT TEST", result.stdout)
+                    _log_lines(logger.warning, "UNIT TEST ERROR", result.stderr)
 
                     if result.returncode == 0:
                         logger.info("All unit tests passed successfully")
@@ -277,7 +297,7 @@ class CineFusionServer:
                     return False
 
             # Original integration test logic
-            test_file = Path(__file__).parent / "test.py"
+            test_file = _TEST_FILE
             if not test_file.exists():
                 logger.error("Test file not found: test.py")
                 return False
@@ -295,15 +315,8 @@ class CineFusionServer:
                 )
 
                 # Log test output
-                if result.stdout:
-                    for line in result.stdout.split("\n"):
-                        if line.strip():
-                            logger.info(f"TEST: {line}")
-
-                if result.stderr:
-                    for line in result.stderr.split("\n"):
-                        if line.strip():
-                            logger.warning(f"TEST ERROR: {line}")
+                _log_lines(logger.info, "TEST", result.stdout)
+                _log_lines(logger.warning, "TEST ERROR", result.stderr)
 
                 if result.returncode == 0:
                     # If return code is 0, tests passed successfully
@@ -364,13 +377,12 @@ class CineFusionServer:
                         "--log-level",
                         "warning",
                         "--access-log",
-                        "--no-access-log" if not self.config.DEBUG else "",
                     ]
                 )
-                # Remove empty strings
-                cmd = [c for c in cmd if c]
+                if not self.config.DEBUG:
+                    cmd.append("--no-access-log")
 
-            logger.info(f"Server command: {' '.join(cmd)}")
+            logger.info(f"Server command: {shlex.join(cmd)}")
             logger.info(f"Server will be available at: http://{host}:{port}")
             logger.info(f"API documentation: http://{host}:{port}/docs")
 
@@ -380,7 +392,7 @@ class CineFusionServer:
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    cwd=Path(__file__).parent,
+                    cwd=_HERE,
                 )
                 self.processes.append(process)
                 logger.info(f"Server started as daemon process (PID: {process.pid})")
@@ -390,8 +402,20 @@ class CineFusionServer:
                 logger.info("Starting server in foreground mode...")
                 logger.info("Press Ctrl+C to stop the server")
 
-                # Execute the server
-                subprocess.run(cmd, cwd=Path(__file__).parent)
+                # exec discards Python's stdio buffers, so push pending output out
+                # first or it is lost when stdout is a pipe or file
+                sys.stdout.flush()
+                sys.stderr.flush()
+
+                # Replace this process with uvicorn; execvp only returns on failure
+                original_cwd = os.getcwd()
+                os.chdir(_HERE)
+                try:
+                    os.execvp(cmd[0], cmd)
+                except OSError as e:
+                    os.chdir(original_cwd)
+                    logger.warning(f"exec failed ({e}), falling back to subprocess")
+                    subprocess.run(cmd, cwd=_HERE)
                 return True
 
         except KeyboardInterrupt:
@@ -423,7 +447,7 @@ class CineFusionServer:
         logger.info("Performing health check...")
 
         health_status = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
             "status": "healthy",
             "checks": {},
         }
@@ -444,8 +468,7 @@ class CineFusionServer:
             health_status["checks"]["data_file"] = False
 
         # Check log directory
-        log_dir = Path(__file__).parent / "logs"
-        health_status["checks"]["log_directory"] = log_dir.exists()
+        health_status["checks"]["log_directory"] = _LOGS_DIR.exists()
 
         # Overall status
         if all(health_status["checks"].values()):
@@ -458,11 +481,13 @@ class CineFusionServer:
 
     def show_status(self) -> Dict[str, Any]:
         """Show server status"""
+        uptime_s = time.monotonic() - self.start_monotonic
         status = {
             "server_name": "CineFusion Backend",
             "version": self.config.APP_VERSION,
             "environment": os.getenv("ENVIRONMENT", "development"),
-            "uptime": str(datetime.now() - self.start_time),
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.start_wall)),
+            "uptime": f"{int(uptime_s // 3600)}:{int(uptime_s // 60) % 60:02d}:{int(uptime_s) % 60:02d}",
             "config": {
                 "host": self.config.HOST,
                 "port": self.config.PORT,
@@ -477,6 +502,23 @@ class CineFusionServer:
         return status
 
 
+def _write_json(data: Dict[str, Any]) -> None:
+    """Stream indented JSON to stdout, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        json.dump(data, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+        return
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    )
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -535,8 +577,15 @@ def main():
 
     args = parser.parse_args()
 
-    # Create server instance
-    server = CineFusionServer()
+    if args.command is None:
+        parser.print_help()
+        sys.exit(1)
+
+    # Create server instance; validate/health never manage child processes
+    if args.command in ("validate", "health"):
+        server = CineFusionServer.for_validation()
+    else:
+        server = CineFusionServer()
 
     try:
         if args.command == "validate":
@@ -574,12 +623,12 @@ def main():
 
         elif args.command == "health":
             health = server.health_check()
-            print(json.dumps(health, indent=2))
+            _write_json(health)
             sys.exit(0 if health["status"] == "healthy" else 1)
 
         elif args.command == "status":
             status = server.show_status()
-            print(json.dumps(status, indent=2, default=str))
+            _write_json(status)
             sys.exit(0)
 
         elif args.command == "all":
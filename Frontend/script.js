@@ -315,6 +315,8 @@ class UIManager {
 		this.state = appState;
 		this.api = apiService;
 		this.searchDebounceTimer = null;
+		this.suggestionRequestId = 0;
+		this.renderedSuggestions = new WeakMap();
 	}
 
 	init() {
@@ -350,6 +352,21 @@ class UIManager {
 			});
 		});
 
+		// Suggestion clicks are delegated to each dropdown once
+		document.querySelectorAll('.search-dropdown').forEach((dropdown) => {
+			dropdown.addEventListener('click', (e) => {
+				const item = e.target.closest('.dropdown-suggestion');
+				if (!item) return;
+				const suggestion = item.dataset.suggestion;
+				const input = dropdown
+					.closest('.search-container')
+					?.querySelector('.search-input');
+				if (input) input.value = suggestion;
+				this.performSearch(suggestion);
+				this.hideSuggestions();
+			});
+		});
+
 		// Search button
 		document.querySelectorAll('.search-btn').forEach((btn) => {
 			btn.addEventListener('click', () => {
@@ -622,6 +639,9 @@ class UIManager {
 			clearTimeout(this.searchDebounceTimer);
 		}
 
+		// Invalidate any request still in flight for an older query
+		const requestId = ++this.suggestionRequestId;
+
 		// Hide suggestions if query is too short
 		if (query.length < 2) {
 			this.hideSuggestions();
@@ -632,8 +652,10 @@ class UIManager {
 		this.searchDebounceTimer = setTimeout(async () => {
 			try {
 				const suggestions = await this.api.getSuggestions(query);
+				if (requestId !== this.suggestionRequestId) return;
 				this.showSuggestions(suggestions, e.target);
 			} catch (error) {
+				if (requestId !== this.suggestionRequestId) return;
 				console.error('Failed to get suggestions:', error);
 				this.hideSuggestions();
 			}
@@ -649,25 +671,27 @@ class UIManager {
 			return;
 		}
 
-		dropdown.innerHTML = suggestions
-			.map(
-				(suggestion) => `
-            <div class="dropdown-suggestion" data-suggestion="${suggestion}">
-                <i class="fas fa-search"></i> ${suggestion}
-            </div>
-        `
-			)
-			.join('');
-
-		// Add click handlers
-		dropdown.querySelectorAll('.dropdown-suggestion').forEach((item) => {
-			item.addEventListener('click', (e) => {
-				const suggestion = e.currentTarget.dataset.suggestion;
-				inputElement.value = suggestion;
-				this.performSearch(suggestion);
-				this.hideSuggestions();
-			});
+		// Leave the dropdown untouched when the list has not changed
+		const renderKey = suggestions.join('\n');
+		if (this.renderedSuggestions.get(dropdown) === renderKey) {
+			dropdown.classList.add('show');
+			return;
+		}
+		this.renderedSuggestions.set(dropdown, renderKey);
+
+		// Build all items off-document and swap them in with a single update;
+		// clicks are handled by the delegated listener on the dropdown
+		const fragment = document.createDocumentFragment();
+		suggestions.forEach((suggestion) => {
+			const item = document.createElement('div');
+			item.className = 'dropdown-suggestion';
+			item.dataset.suggestion = suggestion;
+			const icon = document.createElement('i');
+			icon.className = 'fas fa-search';
+			item.append(icon, ` ${suggestion}`);
+			fragment.appendChild(item);
 		});
+		dropdown.replaceChildren(fragment);
 
 		dropdown.classList.add('show');
 	}
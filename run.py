@@ -4,17 +4,19 @@ CineFusion Development Server
 A simple HTTP server for running the CineFusion web application locally
 """
 
+import io
 import os
 import sys
 import webbrowser
 import http.server
-import socketserver
+import socket
 import threading
 import time
 from pathlib import Path
 
 # Configuration
 DEFAULT_PORT = 8000
+PORT_SEARCH_RANGE = 10
 FRONTEND_DIR = "Frontend"
 
 
@@ -51,6 +53,55 @@ def check_frontend_directory(project_root):
     return True
 
 
+def find_available_port(port, attempts=PORT_SEARCH_RANGE):
+    """Return the first port from `port` onwards that can be bound, or None"""
+    for candidate in range(port, port + attempts):
+        # A bare socket bind is a much cheaper probe than a full server
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                probe.bind(("", candidate))
+            except OSError:
+                print(f"❌ Port {candidate} is already in use")
+                continue
+        return candidate
+    return None
+
+
+class DevServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server that can rebind a port still in TIME_WAIT"""
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class DevRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that sends file bodies with os.sendfile when possible"""
+
+    def copyfile(self, source, outputfile):
+        """Copy a file body to the socket in the kernel, falling back to a read loop"""
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # Directory listings and other in-memory bodies
+            super().copyfile(source, outputfile)
+            return
+
+        if not hasattr(os, "sendfile"):
+            super().copyfile(source, outputfile)
+            return
+
+        offset = source.tell()
+        remaining = os.fstat(in_fd).st_size - offset
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+
 def start_server(port=DEFAULT_PORT):
     """Start the development server"""
     project_root = find_project_root()
@@ -65,61 +116,49 @@ def start_server(port=DEFAULT_PORT):
         # Change to frontend directory
         os.chdir(frontend_path)
 
-        # Create server
-        handler = http.server.SimpleHTTPRequestHandler
+        # Find a free port before creating the one server we need
+        server_port = find_available_port(port)
+        if server_port is None:
+            print("❌ Could not find an available port")
+            return False
+        if server_port != port:
+            print(f"🔄 Using alternative port {server_port}...")
 
-        # Try to start server on the specified port
-        try:
-            with socketserver.TCPServer(("", port), handler) as httpd:
-                server_url = f"http://localhost:{port}"
-
-                print("🚀 CineFusion Development Server")
-                print("=" * 40)
-                print(f"📁 Serving: {frontend_path}")
-                print(f"🌐 URL: {server_url}")
-                print(f"🔗 Direct link: {server_url}/index.html")
-                print("-" * 40)
-                print("💡 Tips:")
-                print("   • Press Ctrl+C to stop the server")
-                print("   • The browser will open automatically")
-                print("   • Refresh the page to see changes")
-                print("=" * 40)
-
-                # Open browser after a short delay
-                def open_browser():
-                    time.sleep(1.5)
-                    try:
-                        webbrowser.open(server_url)
-                        print(f"🌐 Opened {server_url} in your default browser")
-                    except Exception as e:
-                        print(f"⚠️  Could not open browser automatically: {e}")
-                        print(f"   Please open {server_url} manually")
-
-                browser_thread = threading.Thread(target=open_browser)
-                browser_thread.daemon = True
-                browser_thread.start()
-
-                # Start server
-                print(f"🟢 Server running on port {port}...")
-                httpd.serve_forever()
-
-        except OSError as e:
-            if e.errno == 98 or "Address already in use" in str(e):
-                print(f"❌ Port {port} is already in use")
-
-                # Try to find an available port
-                for alt_port in range(port + 1, port + 10):
-                    try:
-                        with socketserver.TCPServer(("", alt_port), handler) as httpd:
-                            print(f"🔄 Trying alternative port {alt_port}...")
-                            return start_server(alt_port)
-                    except OSError:
-                        continue
-
-                print("❌ Could not find an available port")
-                return False
-            else:
-                raise
+        # Create server
+        handler = DevRequestHandler
+
+        with DevServer(("", server_port), handler) as httpd:
+            server_url = f"http://localhost:{server_port}"
+
+            print("🚀 CineFusion Development Server")
+            print("=" * 40)
+            print(f"📁 Serving: {frontend_path}")
+            print(f"🌐 URL: {server_url}")
+            print(f"🔗 Direct link: {server_url}/index.html")
+            print("-" * 40)
+            print("💡 Tips:")
+            print("   • Press Ctrl+C to stop the server")
+            print("   • The browser will open automatically")
+            print("   • Refresh the page to see changes")
+            print("=" * 40)
+
+            # Open browser after a short delay
+            def open_browser():
+                time.sleep(1.5)
+                try:
+                    webbrowser.open(server_url)
+                    print(f"🌐 Opened {server_url} in your default browser")
+                except Exception as e:
+                    print(f"⚠️  Could not open browser automatically: {e}")
+                    print(f"   Please open {server_url} manually")
+
+            browser_thread = threading.Thread(target=open_browser)
+            browser_thread.daemon = True
+            browser_thread.start()
+
+            # Start server
+            print(f"🟢 Server running on port {server_port}...")
+            httpd.serve_forever()
 
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")